@@ -2,11 +2,84 @@
 # Django
 from django.core.exceptions import ValidationError
 from django.db.models import NOT_PROVIDED
+from django.db.models import DecimalField
+from django.db.models import ForeignKey
+from django.db.models import IntegerField
+from django.db.models import ManyToManyField
 from django.utils.translation import gettext_lazy as _
 
 # 3rd-party
+import numpy as np
 import pandas as pd
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+RELATION_FIELDS = (ForeignKey, ManyToManyField)
+
+CLEAN_DATA_HEADER = '''\
+def _clean_data(self):
+    """Clean form fields data column-wise (generated)."""
+    self.errors = self.schema.errors if self.schema else {}
+    df = self._build_frame()
+'''
+
+# Mirrors the per-field body of PandasForm._clean_data — keep in sync
+CLEAN_FIELD_TEMPLATE = '''\
+    col = df[{field!r}]
+    mask = col.map(bool, na_action='ignore').fillna(False).astype(bool)
+    default = self.handle_default({field!r})
+    if callable(default):
+        missing = ~mask
+        df.loc[missing, {field!r}] = [
+            default() for _ in range(int(missing.sum()))
+        ]
+    else:
+        df[{field!r}] = col.where(mask, default)
+    func = self.clean_funcs[{field!r}]
+    if func:
+        try:
+            df[{field!r}] = func(df[{field!r}])
+        except ValidationError as e:
+            self.cached_valid = False
+            self.add_error({field!r}, e)
+'''
+
+CLEAN_DATA_FOOTER = '''\
+    self.cleaned_data = df
+    self.cached_rows = None
+'''
+
+
+def build_clean_data(fields):
+    """Compile a _clean_data specialized for a known field list."""
+    source = CLEAN_DATA_HEADER
+    for field in fields:
+        source += CLEAN_FIELD_TEMPLATE.format(field=field)
+    source += CLEAN_DATA_FOOTER
+    namespace = {'ValidationError': ValidationError}
+    exec(compile(source, '<pandas_form_clean_data>', 'exec'), namespace)
+    func = namespace['_clean_data']
+    func._generated = True
+    return func
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _fused_check(lengths, max_len, codes):
+        """Compute length + membership masks in one pass over the column."""
+        out = np.empty(lengths.size, np.uint8)
+        for i in range(lengths.size):
+            out[i] = (lengths[i] <= max_len) & (codes[i] >= 0)
+        return out
+else:
+    def _fused_check(lengths, max_len, codes):
+        """Compute length + membership masks without numba."""
+        return ((lengths <= max_len) & (codes >= 0)).view(np.uint8)
+
 
 class PandasForm():
     """Pandas abstract form with validation."""
@@ -14,62 +87,89 @@ class PandasForm():
     class Meta:
         fields = []
 
+    def __init_subclass__(cls, **kwargs):
+        """Specialize _clean_data for the subclass field list."""
+        super().__init_subclass__(**kwargs)
+        fields = getattr(getattr(cls, 'Meta', None), 'fields', None)
+        if not fields:
+            return
+        # Only replace the generic implementation or an earlier generated
+        # one — never a custom override, defined here or inherited
+        current = cls._clean_data
+        if current is PandasForm._clean_data or getattr(
+            current, '_generated', False,
+        ):
+            cls._clean_data = build_clean_data(fields)
+
     def __init__(self, data=None):
         """Init pandas form."""
         self.opts = self.Meta
         self.fields = self.opts.fields
+        self.clean_funcs = {
+            item: getattr(self, f'clean_{item}', None)
+            for item in self.fields
+        }
         self.cached_valid = True
         self.data = data
         self.schema = None
         self.pandas_data = None
         self.errors = {}
-        self.row_data = dict()
+        self.cached_rows = None
+
+    @property
+    def cleaned_rows(self):
+        """Row-dict view of the columnar cleaned data, built lazily."""
+        if self.cached_rows is None:
+            self.cached_rows = self.cleaned_data.to_dict('index')
+        return self.cached_rows
 
     def handle_default(self, item):
         """Handle default value."""
         return None
 
+    def _build_frame(self):
+        """Build the working frame from raw input data."""
+        if isinstance(self.data, pd.DataFrame):
+            # Error bookkeeping is positional, so drop the caller's index
+            return self.data.reindex(
+                columns=self.fields,
+            ).reset_index(drop=True)
+        return pd.DataFrame(self.data, columns=self.fields)
+
     def _clean_data(self):
-        """Clean form fields data."""
-        self.cleaned_data = {}
+        """Clean form fields data column-wise."""
         self.errors = self.schema.errors if self.schema else {}
-        for idx, values in enumerate(self.data):
-            self.cleaned_data[idx] = {}
-            for item in self.fields:
+        df = self._build_frame()
+        # Per-field body mirrored in CLEAN_FIELD_TEMPLATE — keep in sync
+        for item in self.fields:
+            col = df[item]
+            mask = col.map(bool, na_action='ignore').fillna(False).astype(bool)
+            default = self.handle_default(item)
+            if callable(default):
+                missing = ~mask
+                df.loc[missing, item] = [
+                    default() for _ in range(int(missing.sum()))
+                ]
+            else:
+                df[item] = col.where(mask, default)
+            func = self.clean_funcs[item]
+            if func:
                 try:
-                    self.cleaned_data[idx][item] = self.handle_default(item)
-                    if item in values and values[item]:
-                        self.cleaned_data[idx][item] = values[item]
-                    func = getattr(self, f'clean_{item}', None)
-                    self.row_data = self.cleaned_data[idx]
-                    if func:
-                        self.cleaned_data[idx][item] = func()
+                    df[item] = func(df[item])
                 except ValidationError as e:
                     self.cached_valid = False
-                    if idx not in self.errors:
-                        self.errors[idx] = {}
-                    if item in self.errors[idx]:
-                        self.errors[idx][item].append(e)
-                    else:
-                        self.errors[idx][item] = [e]
-        self.row_data = dict()
+                    self.add_error(item, e)
+        self.cleaned_data = df
+        self.cached_rows = None
 
     def add_error(self, field, error, row=None):
         """Add error like in django forms."""
-        curr_field = '__all__'
-        parsed_err = ValidationError(error)
-        if field:
-            curr_field = field
-        if row and row not in self.errors:
-            self.errors[row] = {}
-        if row and curr_field in self.errors[row]:
-            self.errors[row][curr_field].append(parsed_err)
-        elif row:
-            self.errors[row][curr_field] = [parsed_err]
-        elif not row and '__all__' in self.errors:
-            self.errors['__all__'].append(parsed_err)
-        elif not row and '__all__' not in self.errors:
-            self.errors['__all__'] = [parsed_err]
+        curr_field = field or '__all__'
+        if row is not None:
+            bucket = self.errors.setdefault(row, {})
+        else:
+            bucket = self.errors
+        bucket.setdefault(curr_field, []).append(ValidationError(error))
 
     def is_valid(self):
         """Check if dataset is valid."""
@@ -77,9 +177,7 @@ class PandasForm():
             return self.cached_valid
         self._clean_data()
         if self.schema:
-            self.pandas_data = pd.DataFrame(
-                self.cleaned_data.values(),
-            )
+            self.pandas_data = self.cleaned_data
             self.schema.validate(
                 self.pandas_data,
             )
@@ -93,6 +191,13 @@ class FieldCheck(object):
     def __init__(self, field_name, *args):
         self.field_name = field_name
         self.df = None
+        self.cached_error = None
+
+    def error(self):
+        """Return the check error, built once per check instance."""
+        if self.cached_error is None:
+            self.cached_error = self.get_error()
+        return self.cached_error
 
 
 class IsInCheck(FieldCheck):
@@ -101,15 +206,38 @@ class IsInCheck(FieldCheck):
     def __init__(self, *args):
         """Init check."""
         self.cached_list = args[1]
+        self.cached_arr = np.asarray(self.cached_list)
+        self.cached_index = pd.Index(self.cached_arr)
+        # Small value sets (e.g. model choices) are dictionary-encoded,
+        # so membership becomes a single int8 code comparison per row.
+        self.use_categorical = len(self.cached_arr) < 128
         super().__init__(*args)
 
     def validate(self, df, **kwargs):  # noqa: D102
+        arr = kwargs.get('col_arr')
+        if arr is None:
+            arr = df[self.field_name].to_numpy()
+        null_mask = pd.isna(arr)
+        if self.use_categorical:
+            codes = pd.Categorical(
+                arr, categories=self.cached_list,
+            ).codes
+            valid = codes != -1
+        else:
+            # np.isin can't order None or mismatched types against a
+            # typed value array, so restrict it to the rows actually
+            # holding a value and hash object columns instead of sorting.
+            present = ~null_mask
+            valid = np.zeros(len(arr), dtype=bool)
+            if arr.dtype == np.object_:
+                valid[present] = (
+                    self.cached_index.get_indexer(arr[present]) != -1
+                )
+            else:
+                valid[present] = np.isin(arr[present], self.cached_arr)
         if kwargs.get('nullable'):
-            return df[
-                df[self.field_name].isin(self.cached_list) &
-                df[self.field_name].isnull()
-            ]
-        return df[self.field_name].isin(self.cached_list)
+            valid |= null_mask
+        return pd.Series(valid, index=df.index)
 
     @staticmethod
     def get_error():
@@ -128,12 +256,18 @@ class LengthCheck(FieldCheck):
         super().__init__(*args)
 
     def validate(self, df, **kwargs):  # noqa: D102
+        vals = kwargs.get('col_arr')
+        if vals is None:
+            vals = df[self.field_name].to_numpy()
+        lengths = np.fromiter(
+            (len(val) if isinstance(val, str) else 0 for val in vals),
+            dtype=np.int32,
+            count=len(vals),
+        )
+        valid = lengths <= self.length
         if kwargs.get('nullable'):
-            return df[
-                df[self.field_name].str.len() <= self.length &
-                df[self.field_name].isnull()
-            ]
-        return df[self.field_name].str.len() <= self.length
+            valid |= pd.isna(vals)
+        return pd.Series(valid, index=df.index)
 
     def get_error(self):
         return ValidationError(
@@ -160,21 +294,68 @@ class PandasValidationColumn():
             'nullable': self.nullable,
         }
 
-    def handle_error(self, check, index):
-        err_string = check.get_error()
-        if index not in self.errors:
-            self.errors[index] = {self.name: [err_string]}
-        else:
-            if self.name in self.errors[index]:
-                self.errors[index][self.name].append(err_string)
-            else:
-                self.errors[index][self.name] = [err_string]
+    def fuse_checks(self, pandas_data, col_arr=None):
+        """Validate a LengthCheck + choice IsInCheck pair in one pass.
 
-    def validate(self, pandas_data):
-        for check in self.checks:
-            validation = check.validate(pandas_data, **self.get_col_kwargs())
-            for index, row in enumerate(validation):
-                self.handle_error(check, index) if not row else None
+        Returns True when the fused kernel handled the column, None when
+        the checks don't match the fusible pattern.
+        """
+        length_check = next(
+            (check for check in self.checks if isinstance(check, LengthCheck)),
+            None,
+        )
+        isin_check = next(
+            (check for check in self.checks if isinstance(check, IsInCheck)),
+            None,
+        )
+        if not (length_check and isin_check and isin_check.use_categorical):
+            return None
+        vals = col_arr
+        if vals is None:
+            vals = pandas_data[self.name].to_numpy()
+        lengths = np.fromiter(
+            (len(val) if isinstance(val, str) else 0 for val in vals),
+            dtype=np.int32,
+            count=len(vals),
+        )
+        codes = pd.Categorical(
+            vals, categories=isin_check.cached_list,
+        ).codes
+        fused = _fused_check(lengths, length_check.length, codes).astype(bool)
+        if self.nullable:
+            fused |= pd.isna(vals)
+        bad_idx = np.flatnonzero(~fused)
+        if bad_idx.size:
+            length_error = length_check.error()
+            isin_error = isin_check.error()
+            for index in bad_idx.tolist():
+                row_errors = self.errors.setdefault(int(index), {})
+                bucket = row_errors.setdefault(self.name, [])
+                if lengths[index] > length_check.length:
+                    bucket.append(length_error)
+                if codes[index] < 0:
+                    bucket.append(isin_error)
+        return True
+
+    def validate(self, pandas_data, col_arr=None):
+        if not self.checks:
+            return
+        if len(self.checks) == 2 and self.fuse_checks(pandas_data, col_arr):
+            return
+        col_kwargs = self.get_col_kwargs()
+        results = np.stack([
+            check.validate(pandas_data, col_arr=col_arr, **col_kwargs).to_numpy()
+            for check in self.checks
+        ])
+        bad = np.argwhere(~results)
+        if not bad.size:
+            return
+        cached_errors = [check.error() for check in self.checks]
+        for check_idx, row_idx in bad.tolist():
+            row_errors = self.errors.setdefault(int(row_idx), {})
+            row_errors.setdefault(self.name, []).append(
+                cached_errors[check_idx],
+            )
 
 
 class PandasValidationFrame(object):
@@ -187,17 +368,24 @@ class PandasValidationFrame(object):
 
     def bind_errors(self, errors):
         for idx, curr in errors.items():
+            row_errors = self.errors.setdefault(idx, {})
             for key, val in curr.items():
-                self.errors[idx][key] = val
+                row_errors[key] = val
 
     def validate(self, pandas_data):
-        index = pandas_data.index
-        # Init errors
-        for val in range(index.start, index.stop):
-            if val not in self.errors:
-                self.errors[val] = {}
+        # Init errors for every row, mutating in place so forms holding a
+        # reference to this dict keep seeing the validation errors
+        for idx in pandas_data.index:
+            self.errors.setdefault(int(idx), {})
+        arrays = {
+            name: pandas_data[name].to_numpy()
+            for name, field in self.cached_fields.items()
+            if field.checks
+        }
         for name, field in self.cached_fields.items():
-            field.validate(pandas_data)
+            if not field.checks:
+                continue
+            field.validate(pandas_data, col_arr=arrays[name])
             if field.errors:
                 self.valid = False
                 self.bind_errors(field.errors)
@@ -214,6 +402,14 @@ class PandasModelForm(PandasForm):
         """Init pandas modelform."""
         super().__init__(data)
         self.model = getattr(self.opts, 'model', None)
+        self.cached_model_fields = {
+            item: self.model._meta.get_field(item)
+            for item in self.fields
+        }
+        self.cached_defaults = {
+            item: field.default if field.default is not NOT_PROVIDED else None
+            for item, field in self.cached_model_fields.items()
+        }
         self.validation_fields = None
         self.cached_relations = dict()
         self.init_validation_types()
@@ -229,25 +425,32 @@ class PandasModelForm(PandasForm):
         field_name = str(curr_field)
         if field_name not in self.cached_relations:
             rel_qs = curr_field.related_model.objects.values_list('id', flat=True)
+            if isinstance(curr_field.related_model._meta.pk, IntegerField):
+                rel_ids = np.fromiter(
+                    rel_qs.iterator(chunk_size=10000),
+                    dtype=np.int64,
+                )
+            else:
+                rel_ids = np.asarray(
+                    list(rel_qs.iterator(chunk_size=10000)),
+                )
             self.cached_relations[field_name] = [IsInCheck(
-                curr_field.name, list(rel_qs)
+                curr_field.name, rel_ids
             )]
         return self.cached_relations[field_name]
 
     def handle_type(self, curr_field):
         """Handle validation types."""
-        type_name = type(curr_field).__name__
         checks = []
         if curr_field.max_length:
             checks.append(LengthCheck(curr_field.name, curr_field.max_length))
-        if type_name in ['ForeignKey', 'ManyToManyField']:
+        is_relation = isinstance(curr_field, RELATION_FIELDS)
+        if is_relation:
             checks += self.handle_relation(curr_field)
         if curr_field.choices:
-            valid_choices = list(dict(curr_field.choices).keys())
+            valid_choices = [choice for choice, label in curr_field.choices]
             checks.append(IsInCheck(curr_field.name, valid_choices))
-        coerce = False
-        if type_name in ['DecimalField', 'ForeignKey', 'ManyToManyField']:
-            coerce = True
+        coerce = is_relation or isinstance(curr_field, DecimalField)
         return PandasValidationColumn(
             curr_field.name,
             self.pandas_data,
@@ -260,12 +463,10 @@ class PandasModelForm(PandasForm):
         """Init validation cached dict."""
         cache_dict = {}
         for item in self.fields:
-            curr_field = self.model._meta.get_field(item)
+            curr_field = self.cached_model_fields[item]
             cache_dict[item] = self.handle_type(curr_field)
         self.validation_fields = cache_dict
 
     def handle_default(self, item):
         """Handle default data type."""
-        curr_field = self.model._meta.get_field(item)
-        if curr_field.default != NOT_PROVIDED:
-            return curr_field.default
+        return self.cached_defaults[item]